@@ -1,12 +1,15 @@
 """
 Main Flask application for SF Domain Reports.
 """
-from dotenv import load_dotenv
-load_dotenv()
+from src.utils.env import ensure_env
+ensure_env()
+
+import functools
 
 from flask import Flask, jsonify
 from config.settings import config
 from src.handlers.webhook import create_webhook_blueprint
+from src.utils.json_provider import OrjsonProvider
 from src.utils.logger import setup_logging
 import logging
 
@@ -16,9 +19,10 @@ logger = setup_logging(config.LOG_LEVEL)
 def create_app():
     """Create and configure Flask application."""
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     
     # Validate configuration
-    config_errors = config.validate()
+    config_errors = config.errors
     if config_errors:
         logger.error(f"Configuration errors: {config_errors}")
         raise ValueError(f"Invalid configuration: {', '.join(config_errors)}")
@@ -52,12 +56,22 @@ def create_app():
     return app
 
 
+@functools.lru_cache(maxsize=None)
+def get_app() -> Flask:
+    """Return the process-wide application, building it on first use."""
+    return create_app()
+
+
+def __getattr__(name: str):
+    """Lazily expose ``app`` for WSGI servers (e.g. ``gunicorn app:app``)."""
+    if name == 'app':
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 if __name__ == '__main__':
-    app = create_app()
-    app.run(
+    get_app().run(
         host='0.0.0.0', 
         port=config.PORT,
         debug=config.DEBUG
     )
-
-app = create_app()
\ No newline at end of file
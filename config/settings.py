@@ -26,11 +26,13 @@ class Config:
     PORT: int = 5000
     DEBUG: bool = False
     LOG_LEVEL: str = "INFO"
+    WEBHOOK_WORKERS: int = 4
+    WEBHOOK_QUEUE_SIZE: int = 32
     
     @classmethod
     def from_env(cls) -> 'Config':
-        """Create config from environment variables."""
-        return cls(
+        """Create config from environment variables and validate it once."""
+        instance = cls(
             AIRTABLE_API_KEY=os.environ.get('AIRTABLE_API_KEY', ''),
             AIRTABLE_BASE_ID=os.environ.get('AIRTABLE_BASE_ID', ''),
             GITHUB_TOKEN=os.environ.get('GITHUB_TOKEN', ''),
@@ -41,8 +43,19 @@ class Config:
             GITHUB_REPORTS_PATH=os.environ.get('GITHUB_REPORTS_PATH', 'reports'),
             PORT=int(os.environ.get('PORT', 5000)),
             DEBUG=os.environ.get('DEBUG', 'False').lower() == 'true',
-            LOG_LEVEL=os.environ.get('LOG_LEVEL', 'INFO')
+            LOG_LEVEL=os.environ.get('LOG_LEVEL', 'INFO'),
+            WEBHOOK_WORKERS=int(os.environ.get('WEBHOOK_WORKERS', 4)),
+            WEBHOOK_QUEUE_SIZE=int(os.environ.get('WEBHOOK_QUEUE_SIZE', 32))
         )
+        object.__setattr__(instance, '_errors', instance.validate())
+        return instance
+    
+    @property
+    def errors(self) -> list[str]:
+        """Validation errors captured when the config was built."""
+        if not hasattr(self, '_errors'):
+            object.__setattr__(self, '_errors', self.validate())
+        return self._errors
     
     def validate(self) -> list[str]:
         """Validate configuration and return list of errors."""
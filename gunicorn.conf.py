@@ -0,0 +1,13 @@
+"""
+Gunicorn configuration for SF Domain Reports.
+
+Loaded automatically by ``gunicorn app:app`` from the project root.
+"""
+
+# Import the app once in the master process so config validation and
+# blueprint registration happen a single time and are shared copy-on-write
+# with the forked workers. Nothing built at import time holds an open socket
+# (the Airtable/GitHub services are created on each worker's first request
+# and the report executor starts its threads on first submit), so this is
+# fork-safe.
+preload_app = True
@@ -4,17 +4,32 @@ Script to verify Airtable setup and configuration.
 """
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from dotenv import load_dotenv
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-load_dotenv()
+from src.utils.env import ensure_env
+ensure_env()
 
 from pyairtable import Api
 from config.settings import config
 
+# Fields each table must expose, keyed by table name. The Keyword
+# Performance table is only read through rollups, so it just needs to exist.
+TABLE_SPECS = {
+    config.AIRTABLE_KEYWORD_PERF_TABLE: [],
+    config.AIRTABLE_REPORTS_TABLE: [
+        'Cost (from Keyword Performance)',
+        'Phone Clicks (from Keyword Performance)',
+        'SMS Clicks (from Keyword Performance)',
+        'Quote Starts (from Keyword Performance)',
+        'Conversions (from Keyword Performance)',
+        'Monthly Performance Report URL'
+    ],
+}
+
 
 def verify_airtable_setup():
     """Verify Airtable configuration and table structure."""
@@ -42,45 +57,35 @@ def verify_airtable_setup():
     # Check tables
     print("2. Checking required tables...")
 
-    # Check Keyword Performance table (where we READ from)
-    try:
-        kp_table = base.table(config.AIRTABLE_KEYWORD_PERF_TABLE)
-        kp_records = kp_table.all(max_records=1)
-        print(f"✅ Table '{config.AIRTABLE_KEYWORD_PERF_TABLE}' accessible")
-    except Exception as e:
-        print(f"❌ Table '{config.AIRTABLE_KEYWORD_PERF_TABLE}' error: {e}")
-        return False
-
-    # Check Reports table (where we WRITE to)
-    try:
-        reports_table = base.table(config.AIRTABLE_REPORTS_TABLE)
-        # Just check if we can access it
-        reports_table.all(max_records=1)
-        print(f"✅ Table '{config.AIRTABLE_REPORTS_TABLE}' accessible (for writing reports)")
-    except Exception as e:
-        print(f"❌ Table '{config.AIRTABLE_REPORTS_TABLE}' error: {e}")
-        print("   → This table is where we'll CREATE new report records")
+    # The table reads are independent, so run them concurrently on the shared
+    # Api client (one requests.Session, so connections are kept alive)
+    table_records = {}
+    failed = False
+    with ThreadPoolExecutor(max_workers=len(TABLE_SPECS)) as executor:
+        futures = {
+            executor.submit(lambda t=name: base.table(t).all(max_records=1)): name
+            for name in TABLE_SPECS
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                table_records[name] = future.result()
+                print(f"✅ Table '{name}' accessible")
+            except Exception as e:
+                print(f"❌ Table '{name}' error: {e}")
+                failed = True
+    if failed:
         return False
 
     print("\n3. Checking table fields...")
 
-    # Check My SF Domain Reports table fields
-    try:
-        reports_table = base.table(config.AIRTABLE_REPORTS_TABLE)
-        reports_records = reports_table.all(max_records=1)
-        
-        print(f"\n   My SF Domain Reports table fields:")
-        required_fields = [
-            'Cost (from Keyword Performance)',
-            'Phone Clicks (from Keyword Performance)',
-            'SMS Clicks (from Keyword Performance)',
-            'Quote Starts (from Keyword Performance)',
-            'Conversions (from Keyword Performance)',
-            'Monthly Performance Report URL'
-        ]
-        
-        if reports_records:
-            fields = list(reports_records[0]['fields'].keys())
+    for name, required_fields in TABLE_SPECS.items():
+        if not required_fields:
+            continue
+        print(f"\n   {name} table fields:")
+        records = table_records[name]
+        if records:
+            fields = records[0]['fields']
             for field in required_fields:
                 if field in fields:
                     print(f"   ✅ {field}")
@@ -88,11 +93,9 @@ def verify_airtable_setup():
                     print(f"   ⚠️  {field} (not found - verify exact field name)")
         else:
             print("   ⚠️  No records to verify fields")
-            print("   Required rollup fields:")
+            print("   Required fields:")
             for field in required_fields:
                 print(f"   - {field}")
-    except Exception as e:
-        print(f"   ❌ Error checking table fields: {e}")
 
     print("\n✅ Airtable setup verification complete!")
     print("\n📝 Summary:")
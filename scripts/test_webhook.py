@@ -6,10 +6,22 @@ import requests
 import json
 import argparse
 from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 from typing import Optional
 
+# Reuse one keep-alive connection pool across calls when scripted in a loop
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
 def send_test_webhook(url: str, report_id: Optional[str] = None):
     """
     Send a test webhook to the specified URL.
@@ -60,20 +72,19 @@ def send_test_webhook(url: str, report_id: Optional[str] = None):
     print(f"Date Range: {start_date} to {end_date}")
     
     try:
-        response = requests.post(
+        response = _SESSION.post(
             url,
             json=payload,
-            headers={'Content-Type': 'application/json'}
+            headers={'Content-Type': 'application/json', 'Connection': 'keep-alive'}
         )
         
         print(f"\nResponse Status: {response.status_code}")
         print(f"Response Body: {json.dumps(response.json(), indent=2)}")
         
-        if response.status_code == 200:
-            print("\n✅ Webhook processed successfully!")
-            data = response.json().get('data', {})
-            if 'report_url' in data:
-                print(f"📊 Report URL: {data['report_url']}")
+        if response.status_code == 202:
+            print("\n✅ Webhook accepted, report is being generated")
+            status_url = url.rsplit('/webhook', 1)[0] + f"/jobs/{report_id}"
+            print(f"📊 Job status: {status_url}")
         else:
             print("\n❌ Webhook processing failed!")
             
@@ -1,6 +1,11 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
 import unittest
 from unittest.mock import patch, MagicMock
-from src.handlers.webhook import process_report
+from flask import Flask
+from src.handlers import webhook
+from src.handlers.webhook import create_webhook_blueprint, process_report
 
 class TestWebhookReportGeneration(unittest.TestCase):
     @patch('src.handlers.webhook.ReportTemplate')
@@ -76,9 +81,122 @@ class TestWebhookReportGeneration(unittest.TestCase):
         self.assertEqual(template_data['sms_clicks'], 10)
         self.assertEqual(template_data['quote_starts'], 4)
         self.assertEqual(template_data['conversions'], 2)
-        self.assertEqual(template_data['cost_per_lead'], 100.0)
+        # 200 / (20 + 10 + 4 + 2) leads, rounded up to a whole number
+        self.assertEqual(template_data['cost_per_lead'], 6)
         self.assertEqual(template_data['report_month'], 'June 2025')
         self.assertEqual(result['report_url'], 'https://example.com/report.html')
 
+    @patch('src.handlers.webhook.ReportTemplate')
+    @patch('src.handlers.webhook.GitHubService')
+    @patch('src.handlers.webhook.AirtableService')
+    def test_total_leads_is_the_sum_of_the_displayed_counts(self, MockAirtableService, MockGitHubService, MockReportTemplate):
+        # Arrange
+        mock_airtable = MockAirtableService.return_value
+        mock_github = MockGitHubService.return_value
+        mock_report_template = MockReportTemplate
+        mock_airtable.get_record_by_id.return_value = {
+            'fields': {
+                'Cost (from Keyword Performance)': 99.5,
+                'Phone Clicks (from Keyword Performance)': 1.2,
+                'SMS Clicks (from Keyword Performance)': 1.2,
+                'Quote Starts (from Keyword Performance)': 0,
+                'Conversions (from Keyword Performance)': 0
+            }
+        }
+        mock_report_template.generate_report.return_value = '<html>report</html>'
+        mock_github.upload_report.return_value = 'https://example.com/report.html'
+        # Act
+        process_report(
+            report_id='rec789',
+            date_start='2025-06-01',
+            date_end='2025-06-30',
+            account_id='999-888-7777',
+            carrier='TestCarrier',
+            airtable_service=mock_airtable,
+            github_service=mock_github
+        )
+        # Assert
+        template_data = mock_report_template.generate_report.call_args[0][0]
+        self.assertEqual(template_data['phone_clicks'], 2)
+        self.assertEqual(template_data['sms_clicks'], 2)
+        self.assertEqual(template_data['total_leads'], 4)
+        # 100 / 4 displayed leads
+        self.assertEqual(template_data['cost_per_lead'], 25)
+
+class TestWebhookEndpoint(unittest.TestCase):
+    def setUp(self):
+        for name in ('get_airtable', 'get_github'):
+            patcher = patch(f'src.handlers.webhook.{name}')
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        app = Flask(__name__)
+        app.register_blueprint(create_webhook_blueprint())
+        self.client = app.test_client()
+
+    def test_malformed_json_returns_400(self):
+        response = self.client.post('/webhook', data=b'{not json', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.get_json()['success'])
+
+    def test_non_object_payload_is_reported_by_validator(self):
+        response = self.client.post('/webhook', json=['not-an-object'])
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('Missing required field: MySFDomainReportRecordID', response.get_json()['errors'])
+
+    def test_non_object_body_is_reported_by_validator(self):
+        for body in ([], 'abc', None):
+            response = self.client.post('/webhook', json={'body': body})
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.get_json()['errors'], [
+                'Missing required field: MySFDomainReportRecordID',
+                'Missing required field: DateStart',
+                'Missing required field: DateEnd'
+            ])
+
+    @patch('src.handlers.webhook.process_report')
+    def test_valid_payload_is_accepted_and_processed_in_background(self, mock_process_report):
+        mock_process_report.return_value = {'report_url': 'https://example.com/report.html'}
+        body = {
+            'MySFDomainReportRecordID': 'recJOB1',
+            'DateStart': '2025-06-01',
+            'DateEnd': '2025-06-30',
+            'AccountID': ['128-903-1394'],
+            'CarrierCompany': ['TestCarrier']
+        }
+        response = self.client.post('/webhook', json=[{'body': body}])
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.get_json()['record_id'], 'recJOB1')
+
+        webhook._jobs['recJOB1'].result(timeout=5)
+        status = self.client.get('/jobs/recJOB1').get_json()
+        self.assertEqual(status['status'], 'completed')
+        self.assertEqual(status['data']['report_url'], 'https://example.com/report.html')
+        self.assertEqual(mock_process_report.call_args.kwargs['carrier'], 'TestCarrier')
+
+    def test_full_queue_returns_503_with_retry_after(self):
+        full = threading.BoundedSemaphore(1)
+        full.acquire()
+        body = {'MySFDomainReportRecordID': 'recFULL', 'DateStart': '2025-06-01', 'DateEnd': '2025-06-30'}
+        with patch('src.handlers.webhook._slots', full):
+            response = self.client.post('/webhook', json={'body': body})
+        self.assertEqual(response.status_code, 503)
+        self.assertIn('Retry-After', response.headers)
+        self.assertIn('report_jobs_rejected_total', self.client.get('/metrics').get_data(as_text=True))
+
+    def test_unknown_job_returns_404(self):
+        self.assertEqual(self.client.get('/jobs/recMISSING').status_code, 404)
+
+    def test_job_history_is_capped(self):
+        with patch('src.handlers.webhook._JOBS_RETAINED', 2), \
+                patch('src.handlers.webhook._jobs', OrderedDict()):
+            for record_id in ('recOLD', 'recMID', 'recNEW'):
+                webhook._remember_job(record_id, Future())
+            self.assertEqual(list(webhook._jobs), ['recMID', 'recNEW'])
+            self.assertEqual(self.client.get('/jobs/recOLD').status_code, 404)
+            # Re-queueing a record makes it the most recent again
+            webhook._remember_job('recMID', Future())
+            webhook._remember_job('recLAST', Future())
+            self.assertEqual(list(webhook._jobs), ['recMID', 'recLAST'])
+
 if __name__ == '__main__':
     unittest.main()
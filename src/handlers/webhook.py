@@ -1,99 +1,270 @@
 """
 Webhook handler for processing SF Domain Report requests.
 """
-from dotenv import load_dotenv
-load_dotenv()
-
 from flask import Blueprint, request, jsonify
-from typing import Dict, Any
+from collections import OrderedDict
+from typing import Dict, Any, TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor
+import calendar
+import functools
 import json
 import logging
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import datetime
 import math
 
+import orjson
+
 from config.settings import config
-from src.services.airtable import AirtableService
-from src.services.github import GitHubService
-from src.templates.report_html import ReportTemplate
 from src.utils.validators import validate_webhook_payload
 
+if TYPE_CHECKING:
+    from src.services.airtable import AirtableService
+    from src.services.github import GitHubService
+
 logger = logging.getLogger(__name__)
 
 
-def create_webhook_blueprint() -> Blueprint:
-    """Create webhook blueprint with routes."""
-    webhook_bp = Blueprint('webhook', __name__)
-    
-    # Initialize services
-    airtable_service = AirtableService(
+def _extract_rollups(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Map the Airtable rollup fields of a report record to template variables."""
+    # Written out literally (rather than looping over a key table) so each
+    # lookup is a constant-key fields.get with the keys held in co_consts.
+    get = fields.get
+    return {
+        'cost': get('Cost (from Keyword Performance)', 0),
+        'phone_clicks': get('Phone Clicks (from Keyword Performance)', 0),
+        'sms_clicks': get('SMS Clicks (from Keyword Performance)', 0),
+        'quote_starts': get('Quote Starts (from Keyword Performance)', 0),
+        'conversions': get('Conversions (from Keyword Performance)', 0),
+    }
+
+
+# Service and template classes are imported on first use so that importing
+# this module (app start-up, /health probes, test collection) doesn't pay for
+# pyairtable/jinja2. Tests patch these module attributes directly.
+AirtableService = None
+GitHubService = None
+ReportTemplate = None
+
+# Reports are generated off the request thread: the webhook validates,
+# submits and acknowledges. At most WEBHOOK_QUEUE_SIZE jobs may be queued or
+# running at once; beyond that the webhook sheds load with a 503. The latest
+# job per record ID is kept so its outcome can be looked up via
+# /jobs/<record_id>, for the most recent _JOBS_RETAINED records only.
+_executor = ThreadPoolExecutor(
+    max_workers=config.WEBHOOK_WORKERS,
+    thread_name_prefix='report-worker'
+)
+_slots = threading.BoundedSemaphore(config.WEBHOOK_QUEUE_SIZE)
+_JOBS_RETAINED = 1000
+_jobs: 'OrderedDict[str, Future]' = OrderedDict()
+_jobs_lock = threading.Lock()
+
+_stats_lock = threading.Lock()
+_stats = {
+    'accepted': 0,
+    'rejected': 0,
+    'completed': 0,
+    'failed': 0,
+    'processing_seconds': 0.0
+}
+
+
+def _run_job(**kwargs: Any) -> Dict[str, Any]:
+    """Run process_report on a worker thread, recording its outcome."""
+    started = time.perf_counter()
+    outcome = 'failed'
+    try:
+        result = process_report(**kwargs)
+        outcome = 'completed'
+        return result
+    finally:
+        with _stats_lock:
+            _stats[outcome] += 1
+            _stats['processing_seconds'] += time.perf_counter() - started
+        _slots.release()
+
+
+def _remember_job(report_id: str, future: Future) -> None:
+    """Record the latest job for a record, forgetting the oldest beyond the cap."""
+    # At most WEBHOOK_QUEUE_SIZE jobs are unfinished, so with the cap well
+    # above that only finished jobs are ever evicted
+    with _jobs_lock:
+        _jobs[report_id] = future
+        _jobs.move_to_end(report_id)
+        while len(_jobs) > _JOBS_RETAINED:
+            _jobs.popitem(last=False)
+
+
+@functools.lru_cache(maxsize=None)
+def get_airtable() -> 'AirtableService':
+    """Return the process-wide Airtable service, creating it on first use."""
+    global AirtableService
+    if AirtableService is None:
+        from src.services.airtable import AirtableService
+    return AirtableService(
         config.AIRTABLE_API_KEY,
         config.AIRTABLE_BASE_ID
     )
-    
-    github_service = GitHubService(
+
+
+@functools.lru_cache(maxsize=None)
+def get_github() -> 'GitHubService':
+    """Return the process-wide GitHub service, creating it on first use."""
+    global GitHubService
+    if GitHubService is None:
+        from src.services.github import GitHubService
+    return GitHubService(
         config.GITHUB_TOKEN,
         config.GITHUB_REPO,
         config.GITHUB_BRANCH
     )
+
+
+def create_webhook_blueprint() -> Blueprint:
+    """Create webhook blueprint with routes."""
+    webhook_bp = Blueprint('webhook', __name__)
     
     @webhook_bp.route('/webhook', methods=['POST'])
     def handle_webhook():
         """Handle incoming webhook from n8n/Airtable."""
         try:
-            # Extract payload
-            payload = request.json
-            if isinstance(payload, list) and len(payload) > 0:
-                payload = payload[0]
-            if not isinstance(payload, dict):
-                logger.error("Invalid payload format: expected dict, got %s", type(payload).__name__)
+            # Extract payload (parse the raw body once; don't keep a copy on request.data)
+            try:
+                payload = orjson.loads(request.get_data(cache=False))
+            except orjson.JSONDecodeError as e:
+                logger.error("Invalid JSON payload: %s", e)
                 return jsonify({
                     'success': False,
                     'error': 'Invalid payload format'
                 }), 400
-
-            body = payload.get('body', {})
+            # n8n sends a single-element list; any other shape (including a
+            # non-object body) yields an empty body and is reported by the
+            # validator below.
+            if isinstance(payload, list) and payload:
+                payload = payload[0]
+            body = payload.get('body') if isinstance(payload, dict) else None
+            if not isinstance(body, dict):
+                body = {}
             
             # Validate payload
             validation_errors = validate_webhook_payload(body)
             if validation_errors:
-                logger.error(f"Validation errors: {validation_errors}")
+                logger.error("Validation errors: %s", validation_errors)
                 return jsonify({
                     'success': False,
                     'errors': validation_errors
                 }), 400
             
-            # Extract data
+            # Extract data (the validator has already checked the shapes, so
+            # each field is looked up once)
             report_id = body['MySFDomainReportRecordID']
             date_start = body['DateStart']
             date_end = body['DateEnd']
-            account_id = body['AccountID'][0] if body.get('AccountID') else 'Unknown'
-            carrier = body['CarrierCompany'][0] if body.get('CarrierCompany') else 'Unknown'
+            account_ids = body.get('AccountID')
+            account_id = account_ids[0] if account_ids else 'Unknown'
+            carriers = body.get('CarrierCompany')
+            carrier = carriers[0] if carriers else 'Unknown'
             
-            logger.info(f"Processing webhook for report: {report_id}")
+            if not _slots.acquire(blocking=False):
+                with _stats_lock:
+                    _stats['rejected'] += 1
+                logger.warning("Report queue full, rejecting: %s", report_id)
+                return jsonify({
+                    'success': False,
+                    'error': 'Report queue is full, retry later'
+                }), 503, {'Retry-After': '30'}
             
-            # Process report
-            result = process_report(
-                report_id=report_id,
-                date_start=date_start,
-                date_end=date_end,
-                account_id=account_id,
-                carrier=carrier,
-                airtable_service=airtable_service,
-                github_service=github_service
-            )
+            logger.info("Queueing report for processing: %s", report_id)
+            
+            # Process report in the background; the Airtable record's report
+            # URL field is the completion signal.
+            try:
+                future = _executor.submit(
+                    _run_job,
+                    report_id=report_id,
+                    date_start=date_start,
+                    date_end=date_end,
+                    account_id=account_id,
+                    carrier=carrier,
+                    airtable_service=get_airtable(),
+                    github_service=get_github()
+                )
+            except Exception:
+                _slots.release()
+                raise
+            _remember_job(report_id, future)
+            with _stats_lock:
+                _stats['accepted'] += 1
             
             return jsonify({
                 'success': True,
-                'data': result
-            }), 200
+                'accepted': True,
+                'record_id': report_id
+            }), 202
             
         except Exception as e:
-            logger.error(f"Webhook processing error: {str(e)}", exc_info=True)
+            logger.error("Webhook processing error: %s", e, exc_info=True)
             return jsonify({
                 'success': False,
                 'error': str(e)
             }), 500
     
+    @webhook_bp.route('/jobs/<report_id>', methods=['GET'])
+    def job_status(report_id: str):
+        """Report the state of the latest job queued for a record."""
+        with _jobs_lock:
+            future = _jobs.get(report_id)
+        if future is None:
+            return jsonify({
+                'success': False,
+                'error': f'No job found for record: {report_id}'
+            }), 404
+        
+        if not future.done():
+            status = 'running' if future.running() else 'queued'
+            return jsonify({'success': True, 'record_id': report_id, 'status': status}), 200
+        
+        error = future.exception()
+        if error is not None:
+            return jsonify({
+                'success': True,
+                'record_id': report_id,
+                'status': 'failed',
+                'error': str(error)
+            }), 200
+        
+        return jsonify({
+            'success': True,
+            'record_id': report_id,
+            'status': 'completed',
+            'data': future.result()
+        }), 200
+    
+    @webhook_bp.route('/metrics', methods=['GET'])
+    def metrics():
+        """Expose report queue counters in Prometheus text format."""
+        with _stats_lock:
+            stats = dict(_stats)
+        depth = stats['accepted'] - stats['completed'] - stats['failed']
+        lines = [
+            '# TYPE report_queue_depth gauge',
+            f'report_queue_depth {depth}',
+            '# TYPE report_jobs_accepted_total counter',
+            f"report_jobs_accepted_total {stats['accepted']}",
+            '# TYPE report_jobs_rejected_total counter',
+            f"report_jobs_rejected_total {stats['rejected']}",
+            '# TYPE report_jobs_completed_total counter',
+            f"report_jobs_completed_total {stats['completed']}",
+            '# TYPE report_jobs_failed_total counter',
+            f"report_jobs_failed_total {stats['failed']}",
+            '# TYPE report_processing_seconds summary',
+            f"report_processing_seconds_sum {stats['processing_seconds']:.6f}",
+            f"report_processing_seconds_count {stats['completed'] + stats['failed']}",
+        ]
+        return '\n'.join(lines) + '\n', 200, {'Content-Type': 'text/plain; version=0.0.4'}
+    
     return webhook_bp
 
 
@@ -103,8 +274,8 @@ def process_report(
     date_end: str,
     account_id: str,
     carrier: str,
-    airtable_service: AirtableService,
-    github_service: GitHubService
+    airtable_service: 'AirtableService',
+    github_service: 'GitHubService'
 ) -> Dict[str, Any]:
     """
     Process a report request.
@@ -121,9 +292,12 @@ def process_report(
     Returns:
         Processing result dictionary
     """
+    global ReportTemplate
+    if ReportTemplate is None:
+        from src.templates.report_html import ReportTemplate
     try:
         # Step 1: Get the record from My SF Domain Reports
-        logger.info(f"Fetching record: {report_id}")
+        logger.info("Fetching record: %s", report_id)
         record = airtable_service.get_record_by_id(
             report_id,
             config.AIRTABLE_REPORTS_TABLE
@@ -133,60 +307,38 @@ def process_report(
         # Step 2: Extract rollup values from the record
         fields = record.get('fields', {})
         # Map Airtable fields to template variables (lowercase, underscores)
-        cost = fields.get('Cost (from Keyword Performance)', 0)
-        phone_clicks = fields.get('Phone Clicks (from Keyword Performance)', 0)
-        sms_clicks = fields.get('SMS Clicks (from Keyword Performance)', 0)
-        quote_starts = fields.get('Quote Starts (from Keyword Performance)', 0)
-        conversions = fields.get('Conversions (from Keyword Performance)', 0)
+        rollups = _extract_rollups(fields)
         # Format report_month based on Date Start and Date End
         try:
-            start_dt = datetime.strptime(date_start, '%Y-%m-%d')
-            end_dt = datetime.strptime(date_end, '%Y-%m-%d')
+            start_dt = datetime.fromisoformat(date_start)
+            end_dt = datetime.fromisoformat(date_end)
             # Check if the range covers the full month
-            first_of_month = start_dt.replace(day=1)
-            # Find last day of month
-            if start_dt.month == 12:
-                next_month = start_dt.replace(year=start_dt.year+1, month=1, day=1)
-            else:
-                next_month = start_dt.replace(month=start_dt.month+1, day=1)
-            last_of_month = next_month - timedelta(days=1)
-            if start_dt == first_of_month and end_dt == last_of_month:
+            last_day = calendar.monthrange(start_dt.year, start_dt.month)[1]
+            last_of_month = start_dt.replace(day=last_day)
+            if start_dt.day == 1 and end_dt == last_of_month:
                 report_month = start_dt.strftime('%B %Y')
             else:
                 report_month = f"{start_dt.strftime('%m-%d-%Y')}-{end_dt.strftime('%m-%d-%Y')}"
         except Exception:
             report_month = f"{date_start}-{date_end}"
-        # Normalize numerical fields to 0 decimal places (round up)
-        def round_up(val):
-            try:
-                return int(math.ceil(float(val)))
-            except Exception:
-                return val
-        cost = round_up(cost)
-        phone_clicks = round_up(phone_clicks)
-        sms_clicks = round_up(sms_clicks)
-        quote_starts = round_up(quote_starts)
-        conversions = round_up(conversions)
-        # Calculate total_leads as the aggregate of quote_starts, phone_clicks, sms_clicks, conversions
-        total_leads = quote_starts + phone_clicks + sms_clicks + conversions
-        # Calculate cost_per_lead using total_leads (avoid division by zero)
+        # Coerce the rollups to float once; a bad value fails the whole report
         try:
-            cost_per_lead = round(float(cost) / float(total_leads), 2) if float(total_leads) else 0.0
-        except Exception:
-            cost_per_lead = 0.0
-        cost_per_lead = round_up(cost_per_lead)
-        # Prepare data for template
-        template_data = {
-            'report_month': report_month,
-            'total_leads': total_leads,
-            'conversions': conversions,
-            'cost': cost,
-            'cost_per_lead': cost_per_lead,
-            'quote_starts': quote_starts,
-            'phone_clicks': phone_clicks,
-            'sms_clicks': sms_clicks
-        }
-        logger.info(f"Extracted metrics for template: {template_data}")
+            values = {key: float(val or 0) for key, val in rollups.items()}
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Non-numeric rollup value in record {report_id}: {e}") from e
+        # Normalize numerical fields to 0 decimal places (round up) in one pass
+        template_data = {key: math.ceil(val) for key, val in values.items()}
+        # Derived metrics use the rounded figures shown in the report, so
+        # total_leads is exactly the sum of the four displayed counts
+        total_leads = (
+            template_data['quote_starts'] + template_data['phone_clicks']
+            + template_data['sms_clicks'] + template_data['conversions']
+        )
+        # cost_per_lead is a whole-dollar figure, rounded up (see README)
+        template_data['total_leads'] = total_leads
+        template_data['cost_per_lead'] = math.ceil(template_data['cost'] / total_leads) if total_leads else 0
+        template_data['report_month'] = report_month
+        logger.debug("Extracted metrics for template: %s", template_data)
         # Step 3: Generate HTML report
         logger.info("Generating HTML report")
         html_content = ReportTemplate.generate_report(
@@ -194,15 +346,13 @@ def process_report(
         )
         # Step 4: Upload to GitHub Pages
         logger.info("Uploading report to GitHub Pages")
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         # Get client name and extract last name (handle Airtable lookup/array fields)
         client_name = fields.get('Client Name', 'Client')
         # Airtable lookup fields are always lists, even if single value
         if isinstance(client_name, list):
             # Remove empty/None values, join if multiple names (rare)
-            client_name = ' '.join([str(x) for x in client_name if x]) if client_name else 'Client'
-        client_name = str(client_name)
-        last_name = client_name.strip().split(' ')[-1] if client_name.strip() else 'Client'
+            client_name = ' '.join(map(str, filter(None, client_name))) if client_name else 'Client'
+        last_name = str(client_name).strip().rpartition(' ')[2] or 'Client'
         # Format report_month for filename (e.g., June-2025)
         safe_report_month = report_month.replace(' ', '-')
         # Build filename as {last_name}_{report_month}.html
@@ -216,15 +366,16 @@ def process_report(
         logger.info("Updating record with report URL")
         updated_record = airtable_service.update_report_url(
             record_id=report_id,
-            report_url=report_url
+            report_url=report_url,
+            table_name=config.AIRTABLE_REPORTS_TABLE
         )
-        logger.info(f"Report processing complete. URL: {report_url}")
+        logger.info("Report processing complete. URL: %s", report_url)
         return {
             'report_url': report_url,
             'record_id': report_id,
             'metrics': template_data,
-            'processing_time': datetime.now().isoformat()
+            'processing_time': time.strftime('%Y-%m-%dT%H:%M:%S')
         }
     except Exception as e:
-        logger.error(f"Error processing report: {str(e)}", exc_info=True)
+        logger.error("Error processing report: %s", e, exc_info=True)
         raise
\ No newline at end of file
@@ -7,8 +7,11 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Currency/grouping characters stripped from numeric strings in one pass
+_STRIP_NUMERIC = str.maketrans('', '', '$,')
 
-@dataclass
+
+@dataclass(slots=True)
 class AggregatedMetrics:
     """Data class for aggregated metrics."""
     conversions: float = 0.0
@@ -73,13 +76,17 @@ class AggregatorService:
         
         logger.info(f"Aggregating {len(records)} keyword performance records")
         
+        # Accumulate into plain local sums and set each metric once at the end,
+        # rather than a getattr/setattr round-trip per field per record
+        sums = dict.fromkeys(self.FIELD_MAPPING, 0.0)
+        parse = self._parse_numeric_value
         for record in records:
             fields = record.get('fields', {})
-            
-            for field_name, attr_name in self.FIELD_MAPPING.items():
-                value = self._parse_numeric_value(fields.get(field_name, 0))
-                current_value = getattr(metrics, attr_name)
-                setattr(metrics, attr_name, current_value + value)
+            for field_name in sums:
+                sums[field_name] += parse(fields.get(field_name, 0))
+        
+        for field_name, attr_name in self.FIELD_MAPPING.items():
+            setattr(metrics, attr_name, sums[field_name])
         
         logger.info(f"Aggregation complete: {metrics.record_count} records processed")
         return metrics
@@ -99,7 +106,7 @@ class AggregatorService:
         
         if isinstance(value, str):
             # Remove common formatting characters
-            cleaned = value.replace('$', '').replace(',', '').strip()
+            cleaned = value.translate(_STRIP_NUMERIC).strip()
             try:
                 return float(cleaned)
             except ValueError:
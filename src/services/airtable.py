@@ -1,22 +1,82 @@
 """
 Airtable service for interacting with Airtable API.
 """
-from typing import Dict, Any, Optional
-from pyairtable import Api
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from pyairtable import Api, Table, retry_strategy
+from requests.adapters import HTTPAdapter
 import logging
+import queue
+import threading
+import time
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# (connect, read) timeout for Airtable API calls, in seconds
+_TIMEOUT = (3.05, 30)
+
+# Short-lived record cache so re-delivered webhooks don't refetch the record
+_RECORD_CACHE_TTL = 60.0
+_RECORD_CACHE_SIZE = 256
+
+# Report URL updates from concurrent webhooks are coalesced into one
+# batch_update of up to 10 records (Airtable's per-request maximum),
+# collected over a short window, and spaced to stay within 5 req/s
+_BATCH_SIZE = 10
+_BATCH_WINDOW = 0.1
+_BATCH_MIN_INTERVAL = 0.2
+
+# Longest update_report_url waits for its queued write, in seconds; an
+# update still queued when this runs out is cancelled, not written later
+_UPDATE_TIMEOUT = 60.0
+
 class AirtableService:
     """Service for Airtable operations."""
     
     def __init__(self, api_key: str, base_id: str):
         """Initialize Airtable service."""
-        self.api = Api(api_key)
+        self.api = Api(api_key, timeout=_TIMEOUT)
+        # The report workers share this one client; give its session a pool
+        # large enough to keep a connection alive per worker, keeping
+        # pyairtable's default 429 retry policy
+        self.api.session.mount('https://', HTTPAdapter(
+            pool_maxsize=20,
+            max_retries=retry_strategy()
+        ))
+        self.api.session.headers['Connection'] = 'keep-alive'
         self.base_id = base_id
+        self._tables: Dict[str, Table] = {}
+        self._record_cache: 'OrderedDict[Tuple[str, str], Tuple[float, Any]]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._pending: 'queue.Queue[Tuple[str, str, Dict[str, Any], Future]]' = queue.Queue()
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_lock = threading.Lock()
+        self._last_write = 0.0
         logger.info(f"Initialized Airtable service for base: {base_id}")
 
+    def _table(self, table_name: str) -> Table:
+        """
+        Get the table handle for a table name, building it once.
+        
+        Args:
+            table_name: Name of the table
+            
+        Returns:
+            pyairtable Table bound to this service's base
+        """
+        table = self._tables.get(table_name)
+        if table is None:
+            table = self._tables.setdefault(table_name, self.api.table(self.base_id, table_name))
+        return table
+
+    def _invalidate(self, table_name: str, record_ids: Iterable[str]) -> None:
+        """Drop cached copies of records that have just been written."""
+        with self._cache_lock:
+            for record_id in record_ids:
+                self._record_cache.pop((table_name, record_id), None)
+
     def update_report_url(
         self, 
         record_id: str,
@@ -35,22 +95,161 @@ class AirtableService:
             Updated record data
         """
         try:
-            table = self.api.table(self.base_id, table_name)
-            fields: Dict[str, Any] = {
-                'Monthly Performance Report URL': report_url
-            }
             logger.info(f"Updating record {record_id} with report URL")
-            record = table.update(record_id, fields)
+            future = self.queue_report_url(record_id, report_url, table_name)
+            try:
+                record = future.result(timeout=_UPDATE_TIMEOUT)
+            except FuturesTimeoutError:
+                # Withdraw the update unless the writer has already started it
+                future.cancel()
+                raise
             logger.info(f"Updated record with report URL: {report_url}")
             return record
         except Exception as e:
             logger.error(f"Error updating record: {str(e)}")
             raise
 
+    def queue_report_url(
+        self,
+        record_id: str,
+        report_url: str,
+        table_name: str = "My SF Domain Reports"
+    ) -> Future:
+        """
+        Queue a report URL update to be sent with other pending updates.
+        
+        Args:
+            record_id: The record ID to update
+            report_url: The generated report URL
+            table_name: Name of the reports table
+            
+        Returns:
+            Future resolving to the updated record once its batch is written
+        """
+        future: Future = Future()
+        fields: Dict[str, Any] = {
+            'Monthly Performance Report URL': report_url
+        }
+        self._pending.put((table_name, record_id, fields, future))
+        self._ensure_flusher()
+        return future
+
+    def _ensure_flusher(self) -> None:
+        """Start the background batch writer on first use."""
+        # Started lazily (not in __init__) so it runs in the process that
+        # uses it, e.g. each gunicorn worker after a preloaded fork
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        with self._flusher_lock:
+            if self._flusher is None or not self._flusher.is_alive():
+                self._flusher = threading.Thread(
+                    target=self._flush_pending,
+                    name='airtable-batch-writer',
+                    daemon=True
+                )
+                self._flusher.start()
+
+    def _flush_pending(self) -> None:
+        """Write queued updates in batches, forever."""
+        while True:
+            # Block for the first update, then collect more for a short window
+            batch = [self._pending.get()]
+            deadline = time.monotonic() + _BATCH_WINDOW
+            while len(batch) < _BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._pending.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            # Skip updates whose callers gave up; the rest can no longer be cancelled
+            batch = [item for item in batch if item[3].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            
+            try:
+                # Group by table; repeated updates to a record are merged
+                by_table: Dict[str, Dict[str, Tuple[Dict[str, Any], List[Future]]]] = {}
+                for table_name, record_id, fields, future in batch:
+                    records = by_table.setdefault(table_name, {})
+                    if record_id in records:
+                        records[record_id][0].update(fields)
+                        records[record_id][1].append(future)
+                    else:
+                        records[record_id] = (dict(fields), [future])
+                
+                for table_name, records in by_table.items():
+                    self._write_batch(table_name, records)
+            except Exception as e:
+                # Never leave a caller waiting on an update that won't be sent
+                logger.error(f"Airtable batch writer error: {str(e)}")
+                self._resolve((item[3] for item in batch), error=e)
+
+    def _write_batch(
+        self,
+        table_name: str,
+        records: Dict[str, Tuple[Dict[str, Any], List[Future]]]
+    ) -> None:
+        """
+        Send one batch_update and resolve the futures waiting on it.
+        
+        Airtable rejects the whole batch if any record in it fails (e.g. a
+        deleted record ID), so on error each record is retried on its own
+        and only the records that still fail see an exception.
+        """
+        table = self._table(table_name)
+        updates = [{'id': record_id, 'fields': fields} for record_id, (fields, _) in records.items()]
+        try:
+            logger.info(f"Writing {len(updates)} queued updates to {table_name}")
+            self._throttle()
+            results = table.batch_update(updates)
+        except Exception as e:
+            logger.warning(f"Batch update failed, retrying records individually: {str(e)}")
+            for record_id, (fields, futures) in records.items():
+                try:
+                    self._throttle()
+                    record = table.update(record_id, fields)
+                except Exception as record_error:
+                    self._resolve(futures, error=record_error)
+                else:
+                    self._resolve(futures, result=record)
+            return
+        finally:
+            self._invalidate(table_name, records)
+        
+        by_id = {record['id']: record for record in results}
+        for record_id, (_, futures) in records.items():
+            self._resolve(futures, result=by_id.get(record_id))
+
+    def _throttle(self) -> None:
+        """Space queued writes to stay within Airtable's rate limit."""
+        wait = self._last_write + _BATCH_MIN_INTERVAL - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._last_write = time.monotonic()
+
+    @staticmethod
+    def _resolve(
+        futures: Iterable[Future],
+        result: Any = None,
+        error: Optional[BaseException] = None
+    ) -> None:
+        """Complete each waiting future that is not already done."""
+        for future in futures:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
     def get_record_by_id(
         self, 
         record_id: str, 
-        table_name: str
+        table_name: str,
+        cache: bool = True
     ) -> Optional[Any]:  # Accept pyairtable's RecordDict or None
         """
         Get a single record by ID.
@@ -58,14 +257,30 @@ class AirtableService:
         Args:
             record_id: The record ID to fetch
             table_name: Name of the table
+            cache: Serve a copy fetched within the last minute, if any;
+                pass False when fresh data is required
             
         Returns:
             Record data or None if not found
         """
+        key = (table_name, record_id)
+        if cache:
+            with self._cache_lock:
+                entry = self._record_cache.get(key)
+                if entry is not None and entry[0] > time.monotonic():
+                    return entry[1]
+        
         try:
-            table = self.api.table(self.base_id, table_name)
+            table = self._table(table_name)
             record = table.get(record_id)
-            return record
         except Exception as e:
             logger.error(f"Error fetching record {record_id}: {str(e)}")
-            return None
\ No newline at end of file
+            return None
+        
+        if cache:
+            with self._cache_lock:
+                self._record_cache[key] = (time.monotonic() + _RECORD_CACHE_TTL, record)
+                self._record_cache.move_to_end(key)
+                while len(self._record_cache) > _RECORD_CACHE_SIZE:
+                    self._record_cache.popitem(last=False)
+        return record
\ No newline at end of file
@@ -2,13 +2,24 @@
 GitHub service for uploading reports to GitHub Pages.
 """
 import base64
+import orjson
+import re
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, Iterable, Union
 import logging
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# (connect, read) timeout for GitHub API calls, in seconds
+_TIMEOUT = (3.05, 30)
+
+# Anything but word characters (Unicode letters and digits included), '.' and
+# '-' is replaced with '_' in report filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w.-]')
+
 
 class GitHubService:
     """Service for GitHub operations."""
@@ -39,11 +50,23 @@ class GitHubService:
         self.username = parts[0]
         self.repo_name = parts[1]
         
+        # One pooled keep-alive session for all API calls
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        ))
+        self.session.headers.update(self.headers)
+        
+        # Blob SHA of files this process has written, keyed by repo path
+        self._sha_cache: Dict[str, str] = {}
+        
         logger.info(f"Initialized GitHub service for {repo}")
     
     def upload_report(
         self, 
-        content: str, 
+        content: Union[str, Iterable[str]], 
         filename: str, 
         path: str = "reports"
     ) -> str:
@@ -51,7 +74,8 @@ class GitHubService:
         Upload HTML report to GitHub repository.
         
         Args:
-            content: HTML content to upload
+            content: HTML content to upload, whole or as an iterable of
+                chunks (e.g. from ``iter_report``)
             filename: Name of the file
             path: Directory path in repository
             
@@ -65,34 +89,36 @@ class GitHubService:
             # Create full path
             file_path = f"{path}/{safe_filename}"
             
-            # Encode content to base64
-            content_bytes = content.encode('utf-8')
-            content_base64 = base64.b64encode(content_bytes).decode('utf-8')
+            # The Contents API takes the file as one base64 string
+            if not isinstance(content, str):
+                content = ''.join(content)
             
-            # Check if file already exists
-            existing_sha = self._get_file_sha(file_path)
+            # Encode content to base64 (always ASCII, so the cheap ASCII decode suffices)
+            content_base64 = base64.b64encode(content.encode('utf-8')).decode('ascii')
             
             # Prepare API request
             url = f"{self.api_base}/repos/{self.repo}/contents/{file_path}"
             
-            data = {
-                'message': f'Add report: {safe_filename}',
-                'content': content_base64,
-                'branch': self.branch
-            }
-            
-            # Include SHA if updating existing file
-            if existing_sha:
-                data['sha'] = existing_sha
-                data['message'] = f'Update report: {safe_filename}'
-            
-            # Make request
-            response = requests.put(url, json=data, headers=self.headers)
+            # Most reports are new files, so PUT straight away (using the SHA
+            # from an earlier upload if we have one). GitHub answers 422 when
+            # an existing file's SHA is missing and 409 when it is stale; only
+            # then look the SHA up and retry.
+            response = self._put_contents(
+                url, safe_filename, content_base64, self._sha_cache.get(file_path)
+            )
+            if response.status_code in (409, 422):
+                existing_sha = self._get_file_sha(file_path)
+                if existing_sha:
+                    response = self._put_contents(url, safe_filename, content_base64, existing_sha)
             
             if response.status_code not in [201, 200]:
                 logger.error(f"GitHub API error: {response.status_code} - {response.text}")
                 raise Exception(f"Failed to upload to GitHub: {response.status_code}")
             
+            sha = response.json().get('content', {}).get('sha')
+            if sha:
+                self._sha_cache[file_path] = sha
+            
             # Generate GitHub Pages URL
             # Use custom domain instead of github.io
             pages_url = f"https://app.agentinsider.co/{file_path}"
@@ -103,6 +129,45 @@ class GitHubService:
             logger.error(f"Error uploading to GitHub: {str(e)}")
             raise
     
+    def _put_contents(
+        self,
+        url: str,
+        safe_filename: str,
+        content_base64: str,
+        sha: Optional[str] = None
+    ) -> requests.Response:
+        """
+        Create or update a file through the Contents API.
+        
+        Args:
+            url: Contents API URL for the file
+            safe_filename: Sanitized filename (used in the commit message)
+            content_base64: Base64-encoded file content
+            sha: SHA of the file being replaced, if updating
+            
+        Returns:
+            API response
+        """
+        data = {
+            'message': f'Add report: {safe_filename}',
+            'content': content_base64,
+            'branch': self.branch
+        }
+        
+        # Include SHA if updating existing file
+        if sha:
+            data['sha'] = sha
+            data['message'] = f'Update report: {safe_filename}'
+        
+        # Serialize with orjson straight to bytes rather than letting requests
+        # run stdlib json.dumps and then encode the resulting str
+        return self.session.put(
+            url,
+            data=orjson.dumps(data),
+            headers={'Content-Type': 'application/json'},
+            timeout=_TIMEOUT
+        )
+    
     def _get_file_sha(self, file_path: str) -> Optional[str]:
         """
         Get SHA of existing file if it exists.
@@ -115,7 +180,7 @@ class GitHubService:
         """
         try:
             url = f"{self.api_base}/repos/{self.repo}/contents/{file_path}"
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, timeout=_TIMEOUT)
             
             if response.status_code == 200:
                 return response.json().get('sha')
@@ -136,14 +201,10 @@ class GitHubService:
         Returns:
             Sanitized filename
         """
-        # Remove or replace unsafe characters
-        safe = filename.replace(' ', '_').replace('/', '_')
-        
-        # Ensure .html extension
-        if not safe.endswith('.html'):
-            safe += '.html'
-        
-        return safe
+        # Ensure .html extension, then replace unsafe characters in one pass
+        if not filename.endswith('.html'):
+            filename += '.html'
+        return _UNSAFE_FILENAME_CHARS.sub('_', filename)
     
     def create_directory_structure(self, paths: list[str]) -> bool:
         """
@@ -0,0 +1,74 @@
+import unittest
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
+from unittest.mock import MagicMock, patch
+
+from src.services.airtable import AirtableService
+
+
+class TestQueuedReportUrlUpdates(unittest.TestCase):
+    def setUp(self):
+        self.service = AirtableService('key', 'appBase')
+        self.table = MagicMock()
+        self.service._tables['Reports'] = self.table
+
+    def test_updates_are_written_as_one_batch(self):
+        self.table.batch_update.side_effect = lambda updates: [
+            {'id': update['id'], 'fields': update['fields']} for update in updates
+        ]
+        first = self.service.queue_report_url('rec1', 'https://example.com/1.html', 'Reports')
+        second = self.service.queue_report_url('rec2', 'https://example.com/2.html', 'Reports')
+        self.assertEqual(first.result(timeout=5)['id'], 'rec1')
+        self.assertEqual(second.result(timeout=5)['id'], 'rec2')
+        self.table.batch_update.assert_called_once()
+        self.table.update.assert_not_called()
+
+    def test_failed_batch_is_retried_per_record(self):
+        self.table.batch_update.side_effect = RuntimeError('INVALID_RECORDS')
+        def update(record_id, fields):
+            if record_id == 'recGone':
+                raise RuntimeError('NOT_FOUND')
+            return {'id': record_id, 'fields': fields}
+        self.table.update.side_effect = update
+        good = self.service.queue_report_url('recGood', 'https://example.com/good.html', 'Reports')
+        gone = self.service.queue_report_url('recGone', 'https://example.com/gone.html', 'Reports')
+        self.assertEqual(good.result(timeout=5)['id'], 'recGood')
+        with self.assertRaisesRegex(RuntimeError, 'NOT_FOUND'):
+            gone.result(timeout=5)
+        self.assertEqual(self.table.update.call_count, 2)
+
+    def test_writer_error_fails_waiting_updates(self):
+        def broken_write(table_name, records):
+            raise RuntimeError('writer crashed')
+        self.service._write_batch = broken_write
+        future = self.service.queue_report_url('rec1', 'https://example.com/1.html', 'Reports')
+        with self.assertRaisesRegex(RuntimeError, 'writer crashed'):
+            future.result(timeout=5)
+        # The writer survives and keeps serving later updates
+        del self.service._write_batch
+        self.table.batch_update.side_effect = lambda updates: [{'id': 'rec2', 'fields': {}}]
+        later = self.service.queue_report_url('rec2', 'https://example.com/2.html', 'Reports')
+        self.assertEqual(later.result(timeout=5)['id'], 'rec2')
+
+    def test_update_report_url_does_not_wait_forever(self):
+        pending = Future()
+        with patch('src.services.airtable._UPDATE_TIMEOUT', 0.01), \
+                patch.object(self.service, 'queue_report_url', return_value=pending):
+            with self.assertRaises(FuturesTimeoutError):
+                self.service.update_report_url('rec1', 'https://example.com/1.html', 'Reports')
+        self.assertTrue(pending.cancelled())
+
+    def test_cancelled_update_is_not_written(self):
+        self.table.batch_update.side_effect = lambda updates: [
+            {'id': update['id'], 'fields': update['fields']} for update in updates
+        ]
+        abandoned = Future()
+        abandoned.cancel()
+        self.service._pending.put(('Reports', 'rec1', {'Monthly Performance Report URL': 'x'}, abandoned))
+        later = self.service.queue_report_url('rec2', 'https://example.com/2.html', 'Reports')
+        self.assertEqual(later.result(timeout=5)['id'], 'rec2')
+        written = [update['id'] for call in self.table.batch_update.call_args_list for update in call.args[0]]
+        self.assertEqual(written, ['rec2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import base64
+import unittest
+from unittest.mock import MagicMock
+
+import orjson
+
+from src.services.github import GitHubService
+
+
+def _response(status_code, body=None):
+    response = MagicMock(status_code=status_code, text='')
+    response.json.return_value = body or {}
+    return response
+
+
+class TestUploadReport(unittest.TestCase):
+    def setUp(self):
+        self.service = GitHubService('token', 'user/repo')
+        self.service.session = MagicMock()
+
+    def _put_bodies(self):
+        return [orjson.loads(call.kwargs['data']) for call in self.service.session.put.call_args_list]
+
+    def test_new_file_is_created_with_a_single_put(self):
+        self.service.session.put.return_value = _response(201, {'content': {'sha': 'sha-new'}})
+        url = self.service.upload_report(content='<html>r</html>', filename='Doe June 2025', path='reports')
+
+        self.assertEqual(url, 'https://app.agentinsider.co/reports/Doe_June_2025.html')
+        self.service.session.get.assert_not_called()
+        body, = self._put_bodies()
+        self.assertNotIn('sha', body)
+        self.assertEqual(base64.b64decode(body['content']).decode('utf-8'), '<html>r</html>')
+        self.assertEqual(self.service._sha_cache['reports/Doe_June_2025.html'], 'sha-new')
+
+    def test_chunked_content_is_joined_before_upload(self):
+        self.service.session.put.return_value = _response(201, {'content': {'sha': 'sha-new'}})
+        self.service.upload_report(content=iter(['<html>', 'Müller', '</html>']), filename='Müller.html')
+
+        body, = self._put_bodies()
+        self.assertEqual(base64.b64decode(body['content']).decode('utf-8'), '<html>Müller</html>')
+
+    def test_conflict_looks_up_the_sha_and_retries(self):
+        self.service.session.put.side_effect = [
+            _response(422),
+            _response(200, {'content': {'sha': 'sha-updated'}})
+        ]
+        self.service.session.get.return_value = _response(200, {'sha': 'sha-existing'})
+        self.service.upload_report(content='<html>r</html>', filename='Doe.html')
+
+        self.service.session.get.assert_called_once()
+        first, second = self._put_bodies()
+        self.assertNotIn('sha', first)
+        self.assertEqual(second['sha'], 'sha-existing')
+        self.assertEqual(second['message'], 'Update report: Doe.html')
+        self.assertEqual(self.service._sha_cache['reports/Doe.html'], 'sha-updated')
+
+    def test_cached_sha_is_sent_without_a_lookup(self):
+        self.service._sha_cache['reports/Doe.html'] = 'sha-cached'
+        self.service.session.put.return_value = _response(200, {'content': {'sha': 'sha-next'}})
+        self.service.upload_report(content='<html>r</html>', filename='Doe.html')
+
+        self.service.session.get.assert_not_called()
+        body, = self._put_bodies()
+        self.assertEqual(body['sha'], 'sha-cached')
+        self.assertEqual(self.service._sha_cache['reports/Doe.html'], 'sha-next')
+
+    def test_stale_cached_sha_is_refreshed(self):
+        self.service._sha_cache['reports/Doe.html'] = 'sha-stale'
+        self.service.session.put.side_effect = [
+            _response(409),
+            _response(200, {'content': {'sha': 'sha-next'}})
+        ]
+        self.service.session.get.return_value = _response(200, {'sha': 'sha-current'})
+        self.service.upload_report(content='<html>r</html>', filename='Doe.html')
+
+        first, second = self._put_bodies()
+        self.assertEqual(first['sha'], 'sha-stale')
+        self.assertEqual(second['sha'], 'sha-current')
+
+    def test_conflict_without_existing_file_fails(self):
+        self.service.session.put.return_value = _response(422)
+        self.service.session.get.return_value = _response(404)
+        with self.assertRaises(Exception):
+            self.service.upload_report(content='<html>r</html>', filename='Doe.html')
+        self.assertEqual(self.service.session.put.call_count, 1)
+        self.assertNotIn('reports/Doe.html', self.service._sha_cache)
+
+
+class TestSanitizeFilename(unittest.TestCase):
+    def setUp(self):
+        self.service = GitHubService('token', 'user/repo')
+
+    def test_unsafe_characters_are_replaced(self):
+        self.assertEqual(self.service._sanitize_filename('Doe/June 2025?'), 'Doe_June_2025_.html')
+
+    def test_non_ascii_names_are_kept_distinct(self):
+        self.assertEqual(self.service._sanitize_filename('Müller_June-2025'), 'Müller_June-2025.html')
+        self.assertNotEqual(
+            self.service._sanitize_filename('Müller_June-2025'),
+            self.service._sanitize_filename('Mäller_June-2025')
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,4 @@
 """Report template generators."""
-from .report_html import ReportTemplate
+from .report_html import ReportTemplate, generate_report, iter_report
 
-__all__ = ['ReportTemplate']
\ No newline at end of file
+__all__ = ['ReportTemplate', 'generate_report', 'iter_report']
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""
+Shared set-up for the local report scripts in this directory.
+"""
+import os
+import sys
+from types import SimpleNamespace
+from typing import Any, Dict
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+REPORTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_reports')
+
+
+def ensure_paths() -> None:
+    """Put the project root on sys.path and create the reports directory."""
+    if PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, PROJECT_ROOT)
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+
+
+def make_airtable_stub(fields: Dict[str, Any]) -> SimpleNamespace:
+    """
+    Build an AirtableService stand-in serving one record.
+
+    Args:
+        fields: Fields of the record returned by get_record_by_id
+
+    Returns:
+        Object with get_record_by_id and update_report_url
+    """
+    record = {'fields': fields}
+    return SimpleNamespace(
+        get_record_by_id=lambda *args, **kwargs: record,
+        update_report_url=lambda *args, **kwargs: {}
+    )
@@ -1,36 +1,155 @@
 """
 HTML report template generation using Jinja2.
 """
-from typing import Dict, Any, Optional
-from jinja2 import Environment, FileSystemLoader
+from typing import Dict, Any, Iterator, Optional, Tuple
+from jinja2 import Environment, FileSystemLoader, Template, nodes
+import functools
 import os
+import re
+
+# Templates ship with the code, so load them from this directory once per
+# process and never re-stat them on render.
+_ENV = Environment(
+    loader=FileSystemLoader(os.path.dirname(os.path.abspath(__file__))),
+    auto_reload=False,
+    cache_size=50
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_template(template_name: str) -> Template:
+    """Load and compile a template once."""
+    return _ENV.get_template(template_name)
+
+
+# Marks where each variable lands when rendering a skeleton
+_SENTINEL_RE = re.compile(r'\x00(\d+)\x00')
+
+# Embedded stylesheets and the whitespace/comments that can be dropped from them
+_STYLE_RE = re.compile(r'(<style[^>]*>)(.*?)(</style>)', re.S)
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE_RE = re.compile(r'\s*([{};,])\s*|(:)\s+|\s+')
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    css = _CSS_COMMENT_RE.sub('', css)
+    css = _CSS_SPACE_RE.sub(lambda m: m.group(1) or m.group(2) or ' ', css)
+    return css.replace(';}', '}').strip()
+
+
+@functools.lru_cache(maxsize=8)
+def _get_skeleton(template_name: str) -> Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+    """
+    Pre-render a template that only substitutes plain variables.
+
+    The report templates are static HTML with a handful of ``{{ name }}``
+    placeholders, so the full Jinja render can be replaced by splicing the
+    values between fixed literal chunks. Embedded ``<style>`` blocks are
+    minified in the process.
+
+    Args:
+        template_name: Name of the HTML template file
+
+    Returns:
+        ``(literals, names)`` where the output is ``literals[0]``, then each
+        ``names[i]`` value followed by ``literals[i + 1]``; or None if the
+        template uses anything beyond plain variables (tags, filters,
+        attribute access, globals) and must go through Jinja
+    """
+    source = _ENV.loader.get_source(_ENV, template_name)[0]
+    names = []
+    for node in _ENV.parse(source).body:
+        if not isinstance(node, nodes.Output):
+            return None
+        for child in node.nodes:
+            if isinstance(child, nodes.Name) and child.name not in _ENV.globals:
+                names.append(child.name)
+            elif not isinstance(child, nodes.TemplateData):
+                return None
+
+    # Let Jinja produce the literal text itself (whitespace and newline
+    # handling included) by rendering sentinels in place of the values
+    unique = list(dict.fromkeys(names))
+    sentinels = {name: f'\x00{i}\x00' for i, name in enumerate(unique)}
+    html = _get_template(template_name).render(sentinels)
+    # The stylesheets are static, so minify them once here rather than
+    # shipping the readable CSS in every report
+    html = _STYLE_RE.sub(lambda m: m.group(1) + _minify_css(m.group(2)) + m.group(3), html)
+    pieces = _SENTINEL_RE.split(html)
+    return tuple(pieces[::2]), tuple(unique[int(i)] for i in pieces[1::2])
+
+
+def generate_report(
+    data: Dict[str, Any],
+    template_name: str = "report_template_v3.html"
+) -> str:
+    """
+    Render the HTML report from the template and data.
+
+    Args:
+        data: Dictionary with report data (e.g., month, total_sales, new_customers, etc.)
+        template_name: Name of the HTML template file
+    Returns:
+        Rendered HTML report as a string
+    """
+    # Rendering is a pure function of the data, so repeat renders of the
+    # same report are served from a cache. Value types are part of the key
+    # so that e.g. 1 and 1.0 (equal, but rendered differently) don't collide.
+    try:
+        key = tuple(sorted((name, type(value), value) for name, value in data.items()))
+        hash(key)
+    except TypeError:
+        return _render(data, template_name)
+    return _render_cached(template_name, key)
+
+
+@functools.lru_cache(maxsize=256)
+def _render_cached(template_name: str, key: Tuple[Tuple[str, type, Any], ...]) -> str:
+    """Render from a hashable snapshot of the data, memoized."""
+    return _render({name: value for name, _, value in key}, template_name)
+
+
+def _render(data: Dict[str, Any], template_name: str) -> str:
+    """Render the HTML report without caching."""
+    return ''.join(iter_report(data, template_name))
+
+
+def iter_report(
+    data: Dict[str, Any],
+    template_name: str = "report_template_v3.html"
+) -> Iterator[str]:
+    """
+    Render the HTML report as a stream of string chunks.
+
+    Joining the chunks gives the same HTML as ``generate_report``; use
+    this when the output is written out piecewise rather than kept whole.
+
+    Args:
+        data: Dictionary with report data
+        template_name: Name of the HTML template file
+    Returns:
+        Iterator over the rendered HTML, in order
+    """
+    skeleton = _get_skeleton(template_name)
+    if skeleton is None:
+        yield from _get_template(template_name).generate(data)
+        return
+    
+    literals, names = skeleton
+    yield literals[0]
+    for name, literal in zip(names, literals[1:]):
+        # Missing variables render empty, like Jinja's Undefined
+        yield str(data[name]) if name in data else ''
+        yield literal
 
 
 class ReportTemplate:
-    """HTML report template generator using Jinja2."""
-
-    @staticmethod
-    def generate_report(
-        data: Dict[str, Any],
-        template_name: str = "report_template_v3.html"
-    ) -> str:
-        """
-        Render the HTML report from the template and data.
-
-        Args:
-            data: Dictionary with report data (e.g., month, total_sales, new_customers, etc.)
-            template_name: Name of the HTML template file
-        Returns:
-            Rendered HTML report as a string
-        """
-        # Set up Jinja2 environment to load templates from the current directory
-        template_dir = os.path.dirname(os.path.abspath(__file__))
-        env = Environment(loader=FileSystemLoader(template_dir))
-        template = env.get_template(template_name)
-        html = template.render(**data)
-        return html
+    """HTML report template generator (kept for existing callers)."""
+
+    generate_report = staticmethod(generate_report)
 
 # Example usage:
 # data = {"month": "June 2025", "total_sales": 10000, "new_customers": 25}
-# html_report = ReportTemplate.generate_report(data)
-# print(html_report)
\ No newline at end of file
+# html_report = generate_report(data)
+# print(html_report)
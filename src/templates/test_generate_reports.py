@@ -3,37 +3,33 @@ Local test script to generate HTML reports using the actual process_report logic
 Saves generated reports to /src/templates/test_reports/.
 """
 import os
-import sys
 from datetime import datetime
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
-# Ensure project root is in sys.path for imports
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-if PROJECT_ROOT not in sys.path:
-    sys.path.insert(0, PROJECT_ROOT)
+try:
+    from ._testutil import REPORTS_DIR, ensure_paths, make_airtable_stub
+except ImportError:  # run directly as a script
+    from _testutil import REPORTS_DIR, ensure_paths, make_airtable_stub
+
+ensure_paths()
 
 from src.handlers.webhook import process_report
 
 def run_local_report_test():
-    # Create test_reports directory if it doesn't exist
-    REPORTS_DIR = os.path.join(os.path.dirname(__file__), 'test_reports')
-    os.makedirs(REPORTS_DIR, exist_ok=True)
-    # Mock AirtableService and GitHubService
-    mock_airtable = MagicMock()
-    mock_github = MagicMock()
-    # Provide test data as returned from Airtable
-    mock_airtable.get_record_by_id.return_value = {
-        'fields': {
-            'Cost (from Keyword Performance)': 123.45,
-            'Phone Clicks (from Keyword Performance)': 12,
-            'SMS Clicks (from Keyword Performance)': 7,
-            'Quote Starts (from Keyword Performance)': 3,
-            'Conversions (from Keyword Performance)': 4
-        }
-    }
-    # GitHub upload just returns a fake URL
-    mock_github.upload_report.return_value = 'https://example.com/test-report.html'
-    mock_airtable.update_report_url.return_value = {}
+    # Stub AirtableService and GitHubService
+    mock_airtable = make_airtable_stub({
+        'Cost (from Keyword Performance)': 123.45,
+        'Phone Clicks (from Keyword Performance)': 12,
+        'SMS Clicks (from Keyword Performance)': 7,
+        'Quote Starts (from Keyword Performance)': 3,
+        'Conversions (from Keyword Performance)': 4
+    })
+    # GitHub upload captures its arguments and just returns a fake URL
+    captured = {}
+    def upload_report(**kwargs):
+        captured.update(kwargs)
+        return 'https://example.com/test-report.html'
+    mock_github = SimpleNamespace(upload_report=upload_report)
 
     # Call the real process_report function
     result = process_report(
@@ -46,7 +42,7 @@ def run_local_report_test():
         github_service=mock_github
     )
     # The HTML is generated inside process_report and passed to upload_report
-    html_content = mock_github.upload_report.call_args[1]['content']
+    html_content = captured['content']
     # Save the HTML to a file
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     filename = f'test_report_{timestamp}.html'
@@ -0,0 +1,62 @@
+import unittest
+from unittest.mock import patch
+
+from jinja2 import ChoiceLoader, DictLoader
+
+from src.templates import report_html
+from src.templates.report_html import _STYLE_RE, _get_skeleton, _get_template, _minify_css, iter_report
+
+SHIPPED_TEMPLATES = ('report_template.html', 'report_template_v2.html', 'report_template_v3.html')
+
+
+def _jinja_render(data, template_name):
+    """Reference output: the plain Jinja render with its stylesheets minified."""
+    html = _get_template(template_name).render(data)
+    return _STYLE_RE.sub(lambda m: m.group(1) + _minify_css(m.group(2)) + m.group(3), html)
+
+
+class TestSkeletonRendering(unittest.TestCase):
+    def test_shipped_templates_match_jinja(self):
+        for template_name in SHIPPED_TEMPLATES:
+            with self.subTest(template=template_name):
+                self.assertIsNotNone(_get_skeleton(template_name))
+                names = _get_skeleton(template_name)[1]
+                # Mix strings and numbers, as process_report passes both
+                data = {name: i if i % 2 else f'<{name}>' for i, name in enumerate(dict.fromkeys(names))}
+                self.assertEqual(''.join(iter_report(data, template_name)), _jinja_render(data, template_name))
+
+    def test_shipped_templates_render_missing_values_empty(self):
+        for template_name in SHIPPED_TEMPLATES:
+            with self.subTest(template=template_name):
+                self.assertEqual(''.join(iter_report({}, template_name)), _jinja_render({}, template_name))
+
+
+class TestJinjaFallback(unittest.TestCase):
+    TEMPLATES = {
+        'plain.html': '<p>{{ client }}</p><i>{{ missing }}</i>',
+        'conditional.html': '<p>{{ client }}</p>{% if leads %}<b>{{ leads }}</b>{% endif %}<i>{{ missing }}</i>',
+    }
+
+    def setUp(self):
+        loader = ChoiceLoader([DictLoader(self.TEMPLATES), report_html._ENV.loader])
+        patcher = patch.object(report_html._ENV, 'loader', loader)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(_get_skeleton.cache_clear)
+        self.addCleanup(_get_template.cache_clear)
+
+    def test_plain_variables_use_the_skeleton(self):
+        self.assertIsNotNone(_get_skeleton('plain.html'))
+        self.assertEqual(''.join(iter_report({'client': 'Doe'}, 'plain.html')), '<p>Doe</p><i></i>')
+
+    def test_tags_fall_back_to_jinja(self):
+        self.assertIsNone(_get_skeleton('conditional.html'))
+        self.assertEqual(
+            ''.join(iter_report({'client': 'Doe', 'leads': 36}, 'conditional.html')),
+            '<p>Doe</p><b>36</b><i></i>'
+        )
+        self.assertEqual(''.join(iter_report({'client': 'Doe'}, 'conditional.html')), '<p>Doe</p><i></i>')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,24 +2,22 @@
 Test script for validating report_month logic and template variable mapping.
 """
 import os
-import sys
-from datetime import datetime
-from unittest.mock import MagicMock
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 
-# Ensure project root is in sys.path for imports
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-if PROJECT_ROOT not in sys.path:
-    sys.path.insert(0, PROJECT_ROOT)
+try:
+    from ._testutil import ensure_paths, make_airtable_stub
+except ImportError:  # run directly as a script
+    from _testutil import ensure_paths, make_airtable_stub
+
+ensure_paths()
 
 from src.handlers.webhook import process_report
 
 def run_report_month_tests():
-    REPORTS_DIR = os.path.join(os.path.dirname(__file__), 'test_reports')
-    os.makedirs(REPORTS_DIR, exist_ok=True)
-    mock_airtable = MagicMock()
-    mock_github = MagicMock()
-    mock_airtable.update_report_url.return_value = {}
-    mock_github.upload_report.return_value = 'https://example.com/test-report.html'
+    mock_github = SimpleNamespace(
+        upload_report=lambda **kwargs: 'https://example.com/test-report.html'
+    )
 
     test_cases = [
         # Full month (June 2025)
@@ -80,8 +78,8 @@ def run_report_month_tests():
         }
     ]
 
-    for i, case in enumerate(test_cases, 1):
-        mock_airtable.get_record_by_id.return_value = {'fields': case['fields']}
+    def _run_case(i, case):
+        mock_airtable = make_airtable_stub(case['fields'])
         result = process_report(
             report_id=f'recTEST{i}',
             date_start=case['date_start'],
@@ -91,7 +89,18 @@ def run_report_month_tests():
             airtable_service=mock_airtable,
             github_service=mock_github
         )
-        template_data = result['metrics']
+        return i, case, result['metrics']
+
+    # PARALLEL=1 runs the cases concurrently; sequential by default so
+    # failures are easy to step through
+    numbered = list(enumerate(test_cases, 1))
+    if os.environ.get('PARALLEL') == '1':
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda args: _run_case(*args), numbered))
+    else:
+        results = [_run_case(i, case) for i, case in numbered]
+
+    for i, case, template_data in results:
         print(f"Test {i}: {case['date_start']} to {case['date_end']}")
         print(f"  Expected report_month: {case['expected']}")
         print(f"  Actual report_month:   {template_data['report_month']}")
@@ -1,5 +1,7 @@
 """Utility functions and helpers."""
 from .logger import setup_logging, get_logger
 from .validators import validate_webhook_payload
+from .json_provider import OrjsonProvider
+from .env import ensure_env
 
-__all__ = ['setup_logging', 'get_logger', 'validate_webhook_payload']
\ No newline at end of file
+__all__ = ['setup_logging', 'get_logger', 'validate_webhook_payload', 'OrjsonProvider', 'ensure_env']
\ No newline at end of file
@@ -0,0 +1,18 @@
+"""
+Environment loading helpers.
+"""
+from dotenv import load_dotenv
+
+_LOADED = False
+
+
+def ensure_env() -> None:
+    """
+    Load variables from ``.env`` into the environment once per process.
+
+    Already-set environment variables take precedence over ``.env`` values.
+    """
+    global _LOADED
+    if not _LOADED:
+        load_dotenv(override=False)
+        _LOADED = True
@@ -0,0 +1,59 @@
+"""
+Flask JSON provider backed by orjson.
+"""
+from typing import Any
+
+import orjson
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes and parses with orjson."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as JSON.
+
+        Args:
+            obj: Data to serialize
+            **kwargs: ``sort_keys`` and ``indent`` are honoured; other
+                stdlib ``json.dumps`` options are ignored
+
+        Returns:
+            JSON string
+        """
+        return self._dumps_bytes(obj, **kwargs).decode('utf-8')
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """
+        Build a JSON response, as ``jsonify`` does.
+
+        The orjson output is used as the response body directly, skipping
+        the bytes -> str -> bytes round-trip of the default provider.
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = self._dumps_bytes(obj, indent=indent) + b'\n'
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+    def _dumps_bytes(self, obj: Any, **kwargs: Any) -> bytes:
+        """Serialize with orjson, mapping stdlib-style options to orjson flags."""
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """
+        Deserialize data as JSON.
+
+        Args:
+            s: Text or UTF-8 bytes
+
+        Returns:
+            Parsed data
+        """
+        return orjson.loads(s)
@@ -0,0 +1,101 @@
+import unittest
+
+from src.utils.validators import validate_webhook_payload
+
+
+def _body(**overrides):
+    body = {
+        'MySFDomainReportRecordID': 'recABC123',
+        'DateStart': '2025-06-01',
+        'DateEnd': '2025-06-30',
+        'AccountID': ['128-903-1394'],
+        'CarrierCompany': ['TestCarrier']
+    }
+    body.update(overrides)
+    return body
+
+
+class TestValidateWebhookPayload(unittest.TestCase):
+    def test_valid_body_has_no_errors(self):
+        self.assertEqual(validate_webhook_payload(_body()), [])
+
+    def test_invalid_record_id(self):
+        for record_id in ('abc123', 're', '', 123, None):
+            self.assertEqual(
+                validate_webhook_payload(_body(MySFDomainReportRecordID=record_id)),
+                ['Invalid MySFDomainReportRecordID format'],
+                record_id
+            )
+
+    def test_malformed_dates(self):
+        for value in ('2025-6-1', '2025/06/01', '2025-02-30', '2025-13-01',
+                      '+025-06-01', '2025-06-01\n', ' 2025-06-01', '2025-06-٠1'):
+            self.assertEqual(
+                validate_webhook_payload(_body(DateStart=value)),
+                ['Invalid date format for DateStart. Expected: YYYY-MM-DD'],
+                repr(value)
+            )
+
+    def test_non_string_dates(self):
+        self.assertEqual(
+            validate_webhook_payload(_body(DateStart=20250601, DateEnd=None)),
+            [
+                'Invalid date format for DateStart. Expected: YYYY-MM-DD',
+                'Invalid date format for DateEnd. Expected: YYYY-MM-DD'
+            ]
+        )
+
+    def test_end_date_before_start_date(self):
+        self.assertEqual(
+            validate_webhook_payload(_body(DateStart='2025-07-01', DateEnd='2025-06-30')),
+            ['DateStart must be before or equal to DateEnd']
+        )
+        # Same day is a valid range; a year apart compares by year first
+        self.assertEqual(validate_webhook_payload(_body(DateEnd='2025-06-01')), [])
+        self.assertEqual(validate_webhook_payload(_body(DateStart='2024-12-01')), [])
+
+    def test_range_is_not_checked_when_a_date_is_invalid(self):
+        self.assertEqual(
+            validate_webhook_payload(_body(DateStart='2025-07-01', DateEnd='bad')),
+            ['Invalid date format for DateEnd. Expected: YYYY-MM-DD']
+        )
+
+    def test_array_fields(self):
+        self.assertEqual(
+            validate_webhook_payload(_body(AccountID='128-903-1394', CarrierCompany=[])),
+            ['AccountID must be an array', 'CarrierCompany array cannot be empty']
+        )
+        # Array fields are optional
+        body = _body()
+        del body['AccountID'], body['CarrierCompany']
+        self.assertEqual(validate_webhook_payload(body), [])
+
+    def test_missing_fields_are_reported_first_in_field_order(self):
+        self.assertEqual(
+            validate_webhook_payload({'DateStart': 'bad', 'AccountID': {}}),
+            [
+                'Missing required field: MySFDomainReportRecordID',
+                'Missing required field: DateEnd',
+                'Invalid date format for DateStart. Expected: YYYY-MM-DD',
+                'AccountID must be an array'
+            ]
+        )
+
+    def test_empty_body_reports_every_required_field(self):
+        self.assertEqual(validate_webhook_payload({}), [
+            'Missing required field: MySFDomainReportRecordID',
+            'Missing required field: DateStart',
+            'Missing required field: DateEnd'
+        ])
+
+    def test_non_dict_body_reports_missing_fields(self):
+        for body in ([], 'abc', None, ['recABC123']):
+            self.assertEqual(validate_webhook_payload(body), [
+                'Missing required field: MySFDomainReportRecordID',
+                'Missing required field: DateStart',
+                'Missing required field: DateEnd'
+            ], repr(body))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,97 @@
 """
 Input validation utilities.
 """
-from typing import Dict, List, Any
-from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from datetime import date
+import re
+
+# Webhook validation error messages
+_ERR_MISSING = "Missing required field: {}"
+_ERR_BAD_RECORD_ID = "Invalid MySFDomainReportRecordID format"
+_ERR_BAD_DATE = "Invalid date format for {}. Expected: YYYY-MM-DD"
+_ERR_DATE_ORDER = "DateStart must be before or equal to DateEnd"
+_ERR_NOT_ARRAY = "{} must be an array"
+_ERR_EMPTY_ARRAY = "{} array cannot be empty"
+
+# Exact YYYY-MM-DD; [0-9] rather than \d so non-ASCII digits don't match
+_DATE_RE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})')
+
+# Distinguishes an absent field from one explicitly set to None
+_MISSING = object()
+
+# Translation table replacing each unsafe filename character with '_'
+_FILENAME_TRANS = str.maketrans(dict.fromkeys('/\\:*?"<>|', '_'))
+_MAX_FILENAME_LENGTH = 100
+_MAX_FILENAME_SCAN = 200
+
+
+def _parse_iso_date(value: str) -> date:
+    """
+    Parse a YYYY-MM-DD date without going through strptime.
+    
+    Only ASCII digits are accepted in each component.
+    
+    Args:
+        value: Date string
+        
+    Returns:
+        Parsed date
+        
+    Raises:
+        ValueError: If the value is not a valid YYYY-MM-DD date
+    """
+    match = _DATE_RE.fullmatch(value) if type(value) is str else None
+    if match is None:
+        raise ValueError(f"Not a YYYY-MM-DD date: {value!r}")
+    year, month, day = map(int, match.groups())
+    return date(year, month, day)
+
+
+def _check_record_id(field: str, value: Any, parsed: Dict[str, str]) -> Optional[str]:
+    """Check the Airtable record ID of the report."""
+    # Parsed JSON only yields exact str instances, so type() is enough
+    if type(value) is not str or value[:3] != 'rec':
+        return _ERR_BAD_RECORD_ID
+    return None
+
+
+def _check_date(field: str, value: Any, parsed: Dict[str, str]) -> Optional[str]:
+    """Check a date field, recording the validated value for later checks."""
+    try:
+        _parse_iso_date(value)
+    except ValueError:
+        return _ERR_BAD_DATE.format(field)
+    parsed[field] = value
+    return None
+
+
+def _check_end_date(field: str, value: Any, parsed: Dict[str, str]) -> Optional[str]:
+    """Check the end date, and that it is not before the start date."""
+    error = _check_date(field, value, parsed)
+    # Validated YYYY-MM-DD strings sort chronologically, so compare them as is
+    if error is None and 'DateStart' in parsed and parsed['DateStart'] > value:
+        return _ERR_DATE_ORDER
+    return error
+
+
+def _check_array(field: str, value: Any, parsed: Dict[str, str]) -> Optional[str]:
+    """Check a lookup field that must be a non-empty array."""
+    if type(value) is not list:
+        return _ERR_NOT_ARRAY.format(field)
+    if not value:
+        return _ERR_EMPTY_ARRAY.format(field)
+    return None
+
+
+# Webhook body schema, checked in a single pass: (field, required, check).
+# Each check returns an error message or None.
+_FIELD_CHECKS: Tuple[Tuple[str, bool, Callable[[str, Any, Dict[str, str]], Optional[str]]], ...] = (
+    ('MySFDomainReportRecordID', True, _check_record_id),
+    ('DateStart', True, _check_date),
+    ('DateEnd', True, _check_end_date),
+    ('AccountID', False, _check_array),
+    ('CarrierCompany', False, _check_array),
+)
 
 
 def validate_webhook_payload(payload: Dict[str, Any]) -> List[str]:
@@ -15,54 +104,27 @@ def validate_webhook_payload(payload: Dict[str, Any]) -> List[str]:
     Returns:
         List of validation errors (empty if valid)
     """
-    errors = []
-    
-    # Required fields
-    required_fields = [
-        'MySFDomainReportRecordID',
-        'DateStart',
-        'DateEnd'
-    ]
-    
-    for field in required_fields:
-        if field not in payload:
-            errors.append(f"Missing required field: {field}")
+    # A body that isn't an object has none of the fields
+    if type(payload) is not dict:
+        payload = {}
     
-    # Validate record ID format
-    if 'MySFDomainReportRecordID' in payload:
-        record_id = payload['MySFDomainReportRecordID']
-        if not isinstance(record_id, str) or not record_id.startswith('rec'):
-            errors.append("Invalid MySFDomainReportRecordID format")
-    
-    # Validate date formats
-    for date_field in ['DateStart', 'DateEnd']:
-        if date_field in payload:
-            try:
-                datetime.strptime(payload[date_field], '%Y-%m-%d')
-            except ValueError:
-                errors.append(f"Invalid date format for {date_field}. Expected: YYYY-MM-DD")
-    
-    # Validate date range
-    if 'DateStart' in payload and 'DateEnd' in payload:
-        try:
-            start_date = datetime.strptime(payload['DateStart'], '%Y-%m-%d')
-            end_date = datetime.strptime(payload['DateEnd'], '%Y-%m-%d')
-            
-            if start_date > end_date:
-                errors.append("DateStart must be before or equal to DateEnd")
-        except ValueError:
-            pass  # Already handled above
-    
-    # Validate array fields
-    array_fields = ['AccountID', 'CarrierCompany']
-    for field in array_fields:
-        if field in payload:
-            if not isinstance(payload[field], list):
-                errors.append(f"{field} must be an array")
-            elif len(payload[field]) == 0:
-                errors.append(f"{field} array cannot be empty")
-    
-    return errors
+    missing = []
+    errors = []
+    append = errors.append
+    parsed: Dict[str, str] = {}
+    
+    for field, required, check in _FIELD_CHECKS:
+        value = payload.get(field, _MISSING)
+        if value is _MISSING:
+            if required:
+                missing.append(_ERR_MISSING.format(field))
+            continue
+        error = check(field, value, parsed)
+        if error is not None:
+            append(error)
+    
+    # Missing fields are reported ahead of invalid ones
+    return missing + errors if missing else errors
 
 
 def validate_airtable_record(record: Dict[str, Any]) -> bool:
@@ -75,16 +137,13 @@ def validate_airtable_record(record: Dict[str, Any]) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if not isinstance(record, dict):
-        return False
-    
-    if 'id' not in record or 'fields' not in record:
-        return False
-    
-    if not isinstance(record['fields'], dict):
-        return False
-    
-    return True
+    # Records come from parsed JSON (pyairtable's RecordDict is a TypedDict),
+    # so they are always exact dicts
+    return (
+        type(record) is dict
+        and 'id' in record
+        and type(record.get('fields')) is dict
+    )
 
 
 def sanitize_filename(filename: str) -> str:
@@ -97,19 +156,15 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    # Remove or replace unsafe characters
-    unsafe_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
-    safe_filename = filename
+    # Only the first 100 characters survive, so clip before scanning (with
+    # headroom for trailing spaces/dots) to bound the work on long input
+    safe_filename = filename.lstrip(' .')[:_MAX_FILENAME_SCAN]
     
-    for char in unsafe_chars:
-        safe_filename = safe_filename.replace(char, '_')
+    # Replace unsafe characters in a single pass
+    safe_filename = safe_filename.translate(_FILENAME_TRANS)
     
-    # Remove leading/trailing spaces and dots
-    safe_filename = safe_filename.strip(' .')
+    # Remove trailing spaces and dots
+    safe_filename = safe_filename.rstrip(' .')
     
     # Limit length
-    max_length = 100
-    if len(safe_filename) > max_length:
-        safe_filename = safe_filename[:max_length]
-    
-    return safe_filename
\ No newline at end of file
+    return safe_filename[:_MAX_FILENAME_LENGTH]
\ No newline at end of file